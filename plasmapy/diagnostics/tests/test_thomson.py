@@ -333,3 +333,152 @@ def test_split_populations():
     deviation = (Skw0 - Skw1) / Skw0 * 100
 
     assert np.all(deviation < 1e-6), "Failed split populations test"
+
+
+def test_plan_matches_spectral_density():
+    """
+    Evaluating a `ThomsonPlan` should give the same result as calling
+    `spectral_density` with the same arguments, for every evaluation.
+    """
+    wavelengths = np.arange(520, 545, 0.01) * u.nm
+    probe_wavelength = 532 * u.nm
+    n = 5e17 * u.cm ** -3
+    probe_vec = np.array([1, 0, 0])
+    scatter_vec = np.array([0, 1, 0])
+
+    plan = thomson.ThomsonPlan(
+        wavelengths,
+        probe_wavelength,
+        n,
+        probe_vec=probe_vec,
+        scatter_vec=scatter_vec,
+    )
+
+    for Te in [5, 10, 20] * u.eV:
+        alpha0, Skw0 = thomson.spectral_density(
+            wavelengths,
+            probe_wavelength,
+            n,
+            Te,
+            Te / 2,
+            ion_species=["C-12 5+"],
+            probe_vec=probe_vec,
+            scatter_vec=scatter_vec,
+        )
+        alpha1, Skw1 = plan.evaluate(Te, Te / 2, ion_species=["C-12 5+"])
+
+        assert np.isclose(alpha0, alpha1)
+        assert np.allclose(Skw0, Skw1)
+
+
+def test_numpy_matches_compiled_multi_species():
+    """
+    The NumPy implementation used by `spectral_density` should match the
+    compiled core used by `ThomsonPlan` for drifting multi-species plasmas.
+    """
+    wavelengths = np.arange(520, 545, 0.01) * u.nm
+    kwargs = {
+        "efract": np.array([0.6, 0.4]),
+        "ifract": np.array([0.7, 0.3]),
+        "ion_species": ["p+", "C-12 5+"],
+        "electron_vel": np.array([[100, 0, 0], [0, 200, 0]]) * u.km / u.s,
+        "ion_vel": np.array([[-500, 0, 0], [0, 500, 0]]) * u.km / u.s,
+    }
+    Te = np.array([10, 50]) * u.eV
+    Ti = np.array([5, 3]) * u.eV
+
+    alpha0, Skw0 = thomson.spectral_density(
+        wavelengths, 532 * u.nm, 5e17 * u.cm ** -3, Te, Ti, **kwargs
+    )
+    plan = thomson.ThomsonPlan(wavelengths, 532 * u.nm, 5e17 * u.cm ** -3)
+    alpha1, Skw1 = plan.evaluate(Te, Ti, **kwargs)
+
+    assert np.isclose(alpha0, alpha1)
+    assert np.allclose(Skw0, Skw1, rtol=1e-10)
+
+
+@pytest.mark.parametrize("Ti", [5 * u.eV, np.array([5]) * u.eV])
+def test_single_ion_temperature_broadcast(Ti):
+    """
+    A single ion temperature should be applied to every ion species.
+    """
+    wavelengths = np.arange(520, 545, 0.01) * u.nm
+    probe_wavelength = 532 * u.nm
+    n = 5e17 * u.cm ** -3
+    ion_species = ["p+", "C-12 5+"]
+    ifract = np.array([0.7, 0.3])
+
+    alpha0, Skw0 = thomson.spectral_density(
+        wavelengths,
+        probe_wavelength,
+        n,
+        10 * u.eV,
+        np.array([5, 5]) * u.eV,
+        ifract=ifract,
+        ion_species=ion_species,
+    )
+    alpha1, Skw1 = thomson.spectral_density(
+        wavelengths,
+        probe_wavelength,
+        n,
+        10 * u.eV,
+        Ti,
+        ifract=ifract,
+        ion_species=ion_species,
+    )
+
+    assert np.allclose(Skw0, Skw1)
+
+
+def test_plan_prepared_inputs():
+    """
+    Evaluating prepared inputs should match `ThomsonPlan.evaluate`, also
+    after replacing fields of the prepared inputs.
+    """
+    plan = thomson.ThomsonPlan(
+        np.arange(520, 545, 0.01) * u.nm, 532 * u.nm, 5e17 * u.cm ** -3
+    )
+    kwargs = {
+        "ifract": np.array([0.7, 0.3]),
+        "ion_species": ["p+", "C-12 5+"],
+        "ion_vel": np.array([[-500, 0, 0], [0, 500, 0]]) * u.km / u.s,
+    }
+
+    inputs = plan.prepare(10 * u.eV, 5 * u.eV, **kwargs)
+    assert isinstance(inputs, thomson.SpectralDensityInputs)
+
+    for Te in [[5], [10], [20]] * u.eV:
+        alpha0, Skw0 = plan.evaluate(Te, 5 * u.eV, **kwargs)
+        alpha1, Skw1 = plan.evaluate_prepared(
+            inputs._replace(Te=Te.to(u.K, equivalencies=u.temperature_energy()).value)
+        )
+
+        assert np.isclose(alpha0.value, alpha1)
+        assert np.allclose(Skw0.value, Skw1)
+
+
+def test_plan_prepared_out():
+    """
+    Evaluating prepared inputs into a provided buffer should fill and
+    return that buffer, and reject buffers of the wrong shape or dtype.
+    """
+    wavelengths = np.arange(520, 545, 0.01) * u.nm
+    plan = thomson.ThomsonPlan(wavelengths, 532 * u.nm, 5e17 * u.cm ** -3)
+    inputs = plan.prepare(10 * u.eV, 5 * u.eV, ion_species="C-12 5+")
+
+    alpha0, Skw0 = plan.evaluate_prepared(inputs)
+    out = np.empty(wavelengths.size)
+    alpha1, Skw1 = plan.evaluate_prepared(inputs, out=out)
+
+    assert Skw1 is out
+    assert np.isclose(alpha0, alpha1)
+    assert np.allclose(Skw0, Skw1)
+
+    with pytest.raises(TypeError):
+        plan.evaluate_prepared(inputs, out=list(out))
+
+    with pytest.raises(ValueError):
+        plan.evaluate_prepared(inputs, out=np.empty(wavelengths.size + 1))
+
+    with pytest.raises(ValueError):
+        plan.evaluate_prepared(inputs, out=np.empty(wavelengths.size, np.float32))
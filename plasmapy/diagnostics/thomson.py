@@ -5,19 +5,52 @@ part of the diagnostics package.
 
 __all__ = [
     "spectral_density",
+    "SpectralDensityInputs",
+    "ThomsonPlan",
 ]
 
 import astropy.constants as const
 import astropy.units as u
+import numba
 import numpy as np
 
+from collections import namedtuple
+from scipy import special
 from typing import List, Tuple, Union
 
-from plasmapy.formulary.dielectric import permittivity_1D_Maxwellian
-from plasmapy.formulary.parameters import plasma_frequency, thermal_speed
 from plasmapy.particles import Particle
 from plasmapy.utils.decorators import validate_quantities
 
+# SI values of the physical constants used by the unitless numerical core
+_c = const.c.si.value
+_e = const.e.si.value
+_eps0 = const.eps0.si.value
+_k_B = const.k_B.si.value
+_m_e = const.m_e.si.value
+
+SpectralDensityInputs = namedtuple(
+    "SpectralDensityInputs",
+    [
+        "Te",
+        "Ti",
+        "efract",
+        "ifract",
+        "ion_z",
+        "ion_mass",
+        "electron_vel",
+        "ion_vel",
+    ],
+)
+SpectralDensityInputs.__doc__ = """
+Validated electron and ion population inputs of `spectral_density`, as
+unitless SI `~numpy.ndarray` objects: temperatures ``Te`` and ``Ti``
+in K, density fractions ``efract`` and ``ifract``, ion charge numbers
+``ion_z``, ion masses ``ion_mass`` in kg, and drift velocities
+``electron_vel`` and ``ion_vel`` in m/s.  Created by
+`ThomsonPlan.prepare`; individual fields can be swapped out with
+``_replace`` for use with `ThomsonPlan.evaluate_prepared`.
+"""
+
 # TODO: interface for inputting a multi-species configuration could be
 # simplified using the plasmapy.classes.plasma_base class if that class
 # included ion and electron drift velocities and information about the ion
@@ -152,6 +185,260 @@ def spectral_density(
     .. _`10.5281/zenodo.3766933`: https://doi.org/10.5281/zenodo.3766933
     .. _`Sheffield`: https://doi.org/10.1016/B978-0-12-374877-5.00003-8
     """
+    geometry = _scattering_geometry(
+        wavelengths.to_value(u.m),
+        probe_wavelength.to_value(u.m),
+        n.to_value(u.m ** -3),
+        probe_vec,
+        scatter_vec,
+    )
+    species = _condition_species(
+        Te, Ti, efract, ifract, ion_species, electron_vel, ion_vel
+    )
+    # a single evaluation is cheaper in NumPy than compiling the numba
+    # core, which is reserved for the repeated evaluations of ThomsonPlan
+    Skw = np.empty(wavelengths.size)
+    alpha = _spectral_density_numpy(*geometry, *species, Skw)
+
+    return alpha * u.dimensionless_unscaled, Skw << u.s / u.rad
+
+
+class ThomsonPlan:
+    r"""
+    Precomputed scattering geometry for repeated evaluations of
+    `spectral_density` on a fixed wavelength grid.
+
+    The scattering frequencies and wavenumbers only depend on the
+    wavelengths, the probe wavelength, the total density, and the probe
+    and scattering directions.  Fitting routines typically hold all of
+    these fixed while varying the temperatures, composition, and drift
+    velocities of the plasma, so a `ThomsonPlan` computes the geometry
+    once and `~ThomsonPlan.evaluate` only runs the spectral density
+    calculation.
+
+    For the tightest loops, `~ThomsonPlan.prepare` validates the plasma
+    populations once and returns them as unitless
+    `SpectralDensityInputs`, which `~ThomsonPlan.evaluate_prepared`
+    evaluates without any further unit handling or input checks.
+
+    Evaluations of a plan run a compiled numerical core, which is
+    compiled on the first evaluation in each session, so a plan pays off
+    when the spectrum is evaluated many times.  Single calls of
+    `spectral_density` use a NumPy implementation instead.
+
+    Parameters
+    ----------
+    wavelengths : `~astropy.units.Quantity`
+        Array of wavelengths over which the spectral density function
+        will be calculated. (convertible to nm)
+
+    probe_wavelength : `~astropy.units.Quantity`
+        Wavelength of the probe laser. (convertible to nm)
+
+    n : `~astropy.units.Quantity`
+        Mean (0th order) density of all plasma components combined.
+        (convertible to cm^-3.)
+
+    probe_vec : float `~numpy.ndarray`, shape (3, )
+        Unit vector in the direction of the probe laser. Defaults to
+        [1, 0, 0].
+
+    scatter_vec : float `~numpy.ndarray`, shape (3, )
+        Unit vector pointing from the scattering volume to the detector.
+        Defaults to [0, 1, 0].
+
+    See Also
+    --------
+    spectral_density
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> wavelengths = np.arange(520, 545, 0.01) * u.nm
+    >>> plan = ThomsonPlan(wavelengths, 532 * u.nm, 5e17 * u.cm ** -3)
+    >>> alpha, Skw = plan.evaluate(10 * u.eV, 10 * u.eV, ion_species="C-12 5+")
+    >>> alpha
+    <Quantity 1.80...>
+    >>> inputs = plan.prepare(10 * u.eV, 10 * u.eV, ion_species="C-12 5+")
+    >>> for Te in [5e4, 1e5, 2e5]:  # in K
+    ...     alpha, Skw = plan.evaluate_prepared(inputs._replace(Te=np.array([Te])))
+    """
+
+    @validate_quantities(
+        wavelengths={"can_be_negative": False},
+        probe_wavelength={"can_be_negative": False},
+        n={"can_be_negative": False},
+    )
+    def __init__(
+        self,
+        wavelengths: u.nm,
+        probe_wavelength: u.nm,
+        n: u.m ** -3,
+        probe_vec=np.array([1, 0, 0]),
+        scatter_vec=np.array([0, 1, 0]),
+    ):
+        self._geometry = _scattering_geometry(
+            wavelengths.to_value(u.m),
+            probe_wavelength.to_value(u.m),
+            n.to_value(u.m ** -3),
+            probe_vec,
+            scatter_vec,
+        )
+
+    @validate_quantities(
+        Te={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+        Ti={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+    )
+    def evaluate(
+        self,
+        Te: u.K,
+        Ti: u.K,
+        efract: np.ndarray = None,
+        ifract: np.ndarray = None,
+        ion_species: Union[str, List[str], Particle, List[Particle]] = "H+",
+        electron_vel: u.m / u.s = None,
+        ion_vel: u.m / u.s = None,
+    ) -> Tuple[Union[np.floating, np.ndarray], np.ndarray]:
+        """
+        Calculate the spectral density function for the plan's geometry.
+
+        The arguments and returned values are the same as for
+        `spectral_density`.
+        """
+        alpha, Skw = self.evaluate_prepared(
+            _condition_species(
+                Te, Ti, efract, ifract, ion_species, electron_vel, ion_vel
+            )
+        )
+
+        return alpha * u.dimensionless_unscaled, Skw << u.s / u.rad
+
+    @validate_quantities(
+        Te={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+        Ti={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+    )
+    def prepare(
+        self,
+        Te: u.K,
+        Ti: u.K,
+        efract: np.ndarray = None,
+        ifract: np.ndarray = None,
+        ion_species: Union[str, List[str], Particle, List[Particle]] = "H+",
+        electron_vel: u.m / u.s = None,
+        ion_vel: u.m / u.s = None,
+    ) -> SpectralDensityInputs:
+        """
+        Validate the plasma populations for `~ThomsonPlan.evaluate_prepared`.
+
+        The arguments are the same as for `spectral_density`.
+        """
+        return _condition_species(
+            Te, Ti, efract, ifract, ion_species, electron_vel, ion_vel
+        )
+
+    def evaluate_prepared(
+        self, inputs: SpectralDensityInputs, out: np.ndarray = None
+    ) -> Tuple[float, np.ndarray]:
+        """
+        Calculate the spectral density function from prepared inputs.
+
+        No unit conversions or consistency checks are performed on
+        ``inputs``, so all of its fields must be float `~numpy.ndarray`
+        objects with the shapes produced by `~ThomsonPlan.prepare`.
+
+        Parameters
+        ----------
+        inputs : `~plasmapy.diagnostics.thomson.SpectralDensityInputs`
+            Plasma populations returned by `~ThomsonPlan.prepare`.
+
+        out : `~numpy.ndarray`, optional
+            A float64 array with one element per wavelength of the plan,
+            into which the spectral density function is written.  If not
+            provided, a new array is allocated.
+
+        Returns
+        -------
+        alpha : float
+            Mean scattering parameter.
+
+        Skw : `~numpy.ndarray`
+            Spectral density function in s/rad.  This is ``out`` if it
+            was provided.
+
+        Raises
+        ------
+        `TypeError`
+            If ``out`` is not a `~numpy.ndarray`.
+
+        `ValueError`
+            If ``out`` does not have the shape of the plan's wavelengths
+            or is not of dtype float64.
+        """
+        Nw = self._geometry[0].size
+        if out is None:
+            Skw = np.empty(Nw)
+        else:
+            if not isinstance(out, np.ndarray):
+                raise TypeError("out must be a numpy.ndarray.")
+            if out.shape != (Nw,):
+                raise ValueError(
+                    f"out must have shape {(Nw,)}, the shape of the "
+                    f"wavelengths, but has shape {out.shape}."
+                )
+            if out.dtype != np.float64:
+                raise ValueError(f"out must be of dtype float64, not {out.dtype}.")
+            Skw = out
+        alpha = _spectral_density_core(*self._geometry, *inputs, Skw)
+
+        return alpha, Skw
+
+
+def _scattering_geometry(wavelengths, probe_wavelength, n, probe_vec, scatter_vec):
+    """
+    Compute the frequency and wavenumber shifts of the scattered light.
+
+    All arguments are unitless SI values.  Returns the frequency shift
+    and wavenumber arrays over ``wavelengths``, the (unnormalized)
+    direction of the wavenumber shift, the total density, and the
+    electron plasma frequency.
+    """
+    # Ensure unit vectors are normalized
+    probe_vec = probe_vec / np.linalg.norm(probe_vec)
+    scatter_vec = scatter_vec / np.linalg.norm(scatter_vec)
+
+    # wpe is calculated for the entire plasma (all electron populations combined)
+    wpe = np.sqrt(n * _e ** 2 / (_eps0 * _m_e))
+
+    # Convert wavelengths to angular frequencies (electromagnetic waves, so
+    # phase speed is c)
+    ws = 2 * np.pi * _c / wavelengths
+    wl = 2 * np.pi * _c / probe_wavelength
+
+    # Compute the frequency shift (required by energy conservation)
+    w = ws - wl
+
+    # Compute the wavenumbers in the plasma
+    # See Sheffield Sec. 1.8.1 and Eqs. 5.4.1 and 5.4.2
+    ks = np.sqrt(ws ** 2 - wpe ** 2) / _c
+    kl = np.sqrt(wl ** 2 - wpe ** 2) / _c
+
+    # Compute the wavenumber shift (required by momentum conservation)
+    # Eq. 1.7.10 in Sheffield, with cos(theta) the dot product of the
+    # (normalized) probe and scattering directions
+    cos_theta = np.dot(probe_vec, scatter_vec)
+    k = np.sqrt(ks ** 2 + kl ** 2 - 2 * ks * kl * cos_theta)
+    # Normal vector along k
+    k_vec = scatter_vec - probe_vec
+
+    return w, k, k_vec, n, wpe
+
+
+def _condition_species(Te, Ti, efract, ifract, ion_species, electron_vel, ion_vel):
+    """
+    Check the consistency of the electron and ion population inputs
+    of `spectral_density` and strip them down to unitless SI arrays.
+    """
     if efract is None:
         efract = np.ones(1)
     else:
@@ -196,7 +483,7 @@ def spectral_density(
     if Ti.size == 1:
         # If a single quantity is given, put it in an array so it's iterable
         # If Ti.size != len(ion_species), assume same temp. for all species
-        Ti = [Ti.value] * len(ion_species) * Ti.unit
+        Ti = np.repeat(Ti, len(ion_species))
     elif Ti.size != len(ion_species):
         raise ValueError(
             f"Got {Ti.size} ion temperatures and expected {len(ion_species)}."
@@ -221,101 +508,216 @@ def spectral_density(
             f"Te ({Te.size}), or electron velocity ({electron_vel.shape[0]})."
         )
 
-    # Ensure unit vectors are normalized
-    probe_vec = probe_vec / np.linalg.norm(probe_vec)
-    scatter_vec = scatter_vec / np.linalg.norm(scatter_vec)
-
-    # Define some constants
-    C = const.c.si  # speed of light
-
-    # Calculate plasma parameters
-    vTe = thermal_speed(Te, particle="e-")
-    vTi, ion_z = [], []
-    for T, ion in zip(Ti, ion_species):
-        vTi.append(thermal_speed(T, particle=ion).value)
-        ion_z.append(ion.charge_number * u.dimensionless_unscaled)
-    vTi = vTi * vTe.unit
+    # The thermal speeds are evaluated in the numerical core, so only the
+    # ion charges and masses are needed from the species
+    ion_z = np.array([ion.charge_number for ion in ion_species], dtype=np.float64)
+    ion_mass = np.array([ion.mass.to_value(u.kg) for ion in ion_species])
+
+    return SpectralDensityInputs(
+        Te=Te.to_value(u.K),
+        Ti=Ti.to_value(u.K),
+        efract=efract,
+        ifract=ifract,
+        ion_z=ion_z,
+        ion_mass=ion_mass,
+        electron_vel=electron_vel.to_value(u.m / u.s),
+        ion_vel=ion_vel.to_value(u.m / u.s),
+    )
+
+
+def _spectral_density_numpy(
+    w,
+    k,
+    k_vec,
+    n,
+    wpe,
+    Te,
+    Ti,
+    efract,
+    ifract,
+    ion_z,
+    ion_mass,
+    electron_vel,
+    ion_vel,
+    Skw,
+):
+    """
+    NumPy counterpart of `_spectral_density_core`, taking the same
+    arguments, used by `spectral_density` for one-off evaluations that
+    would not make up for the time spent compiling the numba core.  The
+    susceptibilities are computed for all species and wavelengths at
+    once as arrays of shape (number of species, number of wavelengths).
+    """
     zbar = np.sum(ifract * ion_z)
     ne = efract * n
     ni = ifract * n / zbar  # ne/zbar = sum(ni)
-    # wpe is calculated for the entire plasma (all electron populations combined)
-    wpe = plasma_frequency(n=n, particle="e-")
 
-    # Convert wavelengths to angular frequencies (electromagnetic waves, so
-    # phase speed is c)
-    ws = (2 * np.pi * u.rad * C / wavelengths).to(u.rad / u.s)
-    wl = (2 * np.pi * u.rad * C / probe_wavelength).to(u.rad / u.s)
-
-    # Compute the frequency shift (required by energy conservation)
-    w = ws - wl
-
-    # Compute the wavenumbers in the plasma
-    # See Sheffield Sec. 1.8.1 and Eqs. 5.4.1 and 5.4.2
-    ks = np.sqrt(ws ** 2 - wpe ** 2) / C
-    kl = np.sqrt(wl ** 2 - wpe ** 2) / C
-
-    # Compute the wavenumber shift (required by momentum conservation)
-    scattering_angle = np.arccos(np.dot(probe_vec, scatter_vec))
-    # Eq. 1.7.10 in Sheffield
-    k = np.sqrt(ks ** 2 + kl ** 2 - 2 * ks * kl * np.cos(scattering_angle))
-    # Normal vector along k
-    k_vec = (scatter_vec - probe_vec) * u.dimensionless_unscaled
-
-    # Compute Doppler-shifted frequencies for both the ions and electrons
-    # Matmul is simultaneously conducting dot product over all wavelengths
-    # and ion components
-    w_e = w - np.matmul(electron_vel, np.outer(k, k_vec).T)
-    w_i = w - np.matmul(ion_vel, np.outer(k, k_vec).T)
-
-    # Compute the scattering parameter alpha
-    # expressed here using the fact that v_th/w_p = root(2) * Debye length
-    alpha = np.sqrt(2) * wpe / np.outer(k, vTe)
-
-    # Calculate the normalized phase velocities (Sec. 3.4.2 in Sheffield)
-    xe = (np.outer(1 / vTe, 1 / k) * w_e).to(u.dimensionless_unscaled)
-    xi = (np.outer(1 / vTi, 1 / k) * w_i).to(u.dimensionless_unscaled)
-
-    # Calculate the susceptibilities
-
-    chiE = np.zeros([efract.size, w.size], dtype=np.complex128)
-    for i, fract in enumerate(efract):
-        chiE[i, :] = permittivity_1D_Maxwellian(w_e[i, :], k, Te[i], ne[i], "e-")
-
-    # Treatment of multiple species is an extension of the discussion in
-    # Sheffield Sec. 5.1
-    chiI = np.zeros([ifract.size, w.size], dtype=np.complex128)
-    for i, ion in enumerate(ion_species):
-        chiI[i, :] = permittivity_1D_Maxwellian(
-            w_i[i, :], k, Ti[i], ni[i], ion, z_mean=ion_z[i]
-        )
+    # Most probable thermal speeds of every species, see thermal_speed
+    vTe = np.sqrt(2 * _k_B * Te / _m_e)
+    vTi = np.sqrt(2 * _k_B * Ti / ion_mass)
+
+    # See _spectral_density_core for the derivation of these factors
+    kDe2 = ne * _e ** 2 / (_eps0 * _k_B * Te)
+    kDi2 = ni * (ion_z * _e) ** 2 / (_eps0 * _k_B * Ti)
+    coef_e = efract * 2 * np.sqrt(np.pi) / vTe
+    coef_i = ifract * 2 * np.sqrt(np.pi) * ion_z / vTi
+
+    ve_k = electron_vel @ k_vec
+    vi_k = ion_vel @ k_vec
+
+    # Normalized phase velocities of every species at every wavelength
+    xe = (w - np.outer(ve_k, k)) / np.outer(vTe, k)
+    xi = (w - np.outer(vi_k, k)) / np.outer(vTi, k)
+
+    half_inv_k2 = 0.5 / k ** 2
+    dZe_re, dZe_im = _plasma_dispersion_func_deriv(xe)
+    sumChiE_re = -half_inv_k2 * (kDe2 @ dZe_re)
+    sumChiE_im = -half_inv_k2 * (kDe2 @ dZe_im)
+    sumFe = coef_e @ np.exp(-(xe ** 2))
+
+    dZi_re, dZi_im = _plasma_dispersion_func_deriv(xi)
+    sumChiI_re = -half_inv_k2 * (kDi2 @ dZi_re)
+    sumChiI_im = -half_inv_k2 * (kDi2 @ dZi_im)
+    sumFi = coef_i @ np.exp(-(xi ** 2))
+
+    epsilon_re = 1 + sumChiE_re + sumChiI_re
+    epsilon_im = sumChiE_im + sumChiI_im
+
+    inv_epsilon2 = 1 / (epsilon_re ** 2 + epsilon_im ** 2)
+    ratio_re = (sumChiE_re * epsilon_re + sumChiE_im * epsilon_im) * inv_epsilon2
+    ratio_im = (sumChiE_im * epsilon_re - sumChiE_re * epsilon_im) * inv_epsilon2
+    fe = (1 - ratio_re) ** 2 + ratio_im ** 2
+    fi = ratio_re ** 2 + ratio_im ** 2
+
+    Skw[:] = (fe * sumFe + fi * sumFi) / k
+
+    return np.sqrt(2) * wpe * np.mean(1 / vTe) * np.mean(1 / k)
+
+
+@numba.njit(parallel=True, fastmath=True, error_model="numpy")
+def _spectral_density_core(
+    w,
+    k,
+    k_vec,
+    n,
+    wpe,
+    Te,
+    Ti,
+    efract,
+    ifract,
+    ion_z,
+    ion_mass,
+    electron_vel,
+    ion_vel,
+    Skw,
+):
+    """
+    Unitless numerical core of `spectral_density`.
+
+    The first arguments are the scattering geometry returned by
+    `_scattering_geometry`, followed by the species arrays returned by
+    `_condition_species`.  The spectral density function (in s/rad) is
+    written into ``Skw``, which must have the same size as ``w``, and
+    the mean scattering parameter is returned.  Each wavelength is
+    independent, so the sweep over ``w`` and ``k`` is compiled into a
+    single parallel loop.
+    """
+    Ne = efract.size
+    Ni = ifract.size
+    Nw = w.size
 
-    # Calculate the longitudinal dielectric function
-    epsilon = 1 + np.sum(chiE, axis=0) + np.sum(chiI, axis=0)
-
-    econtr = np.zeros([efract.size, w.size], dtype=np.complex128) * u.s / u.rad
-    for m in range(efract.size):
-        econtr[m, :] = efract[m] * (
-            2
-            * np.sqrt(np.pi)
-            / k
-            / vTe[m]
-            * np.power(np.abs(1 - np.sum(chiE, axis=0) / epsilon), 2)
-            * np.exp(-xe[m, :] ** 2)
-        )
+    zbar = np.sum(ifract * ion_z)
+    ne = efract * n
+    ni = ifract * n / zbar  # ne/zbar = sum(ni)
 
-    icontr = np.zeros([ifract.size, w.size], dtype=np.complex128) * u.s / u.rad
-    for m in range(ifract.size):
-        icontr[m, :] = ifract[m] * (
-            2
-            * np.sqrt(np.pi)
-            * ion_z[m]
-            / k
-            / vTi[m]
-            * np.power(np.abs(np.sum(chiE, axis=0) / epsilon), 2)
-            * np.exp(-xi[m, :] ** 2)
-        )
+    # Most probable thermal speeds of every species, see thermal_speed
+    vTe = np.sqrt(2 * _k_B * Te / _m_e)
+    vTi = np.sqrt(2 * _k_B * Ti / ion_mass)
+
+    # Species-dependent factors that do not change across the wavelength
+    # sweep: the squared inverse Debye lengths, for which
+    # chi = -(1 / 2) (kD / k) ** 2 Z'(x), and the prefactors of each
+    # species' contribution to Skw
+    kDe2 = ne * _e ** 2 / (_eps0 * _k_B * Te)
+    kDi2 = ni * (ion_z * _e) ** 2 / (_eps0 * _k_B * Ti)
+    coef_e = efract * 2 * np.sqrt(np.pi) / vTe
+    coef_i = ifract * 2 * np.sqrt(np.pi) * ion_z / vTi
+
+    # Project the drift velocities onto k_vec once, so that the Doppler shift
+    # at each wavelength is a single multiply
+    ve_k = np.sum(electron_vel * k_vec, axis=1)
+    vi_k = np.sum(ion_vel * k_vec, axis=1)
+
+    for j in numba.prange(Nw):
+        # Compute Doppler-shifted frequencies and the normalized phase
+        # velocities (Sec. 3.4.2 in Sheffield), then the susceptibilities
+        # chi = -(alpha_s ** 2 / 2) Z'(x), where
+        # alpha_s ** 2 = 1 / (k * lambda_D,s) ** 2
+        # (see permittivity_1D_Maxwellian)
+        # The susceptibilities are summed over species as they are produced,
+        # keeping real and imaginary parts separate so that everything
+        # downstream is real arithmetic, and the Maxwellian factors of each
+        # species' contribution to Skw are accumulated alongside them
+        half_inv_k2 = 0.5 / k[j] ** 2
+        sumChiE_re = 0.0
+        sumChiE_im = 0.0
+        sumFe = 0.0
+        for m in range(Ne):
+            xe = (w[j] - k[j] * ve_k[m]) / (vTe[m] * k[j])
+            dZ_re, dZ_im = _plasma_dispersion_func_deriv_jit(xe)
+            sumChiE_re -= kDe2[m] * half_inv_k2 * dZ_re
+            sumChiE_im -= kDe2[m] * half_inv_k2 * dZ_im
+            sumFe += coef_e[m] * np.exp(-(xe ** 2))
+
+        # Treatment of multiple species is an extension of the discussion in
+        # Sheffield Sec. 5.1
+        sumChiI_re = 0.0
+        sumChiI_im = 0.0
+        sumFi = 0.0
+        for m in range(Ni):
+            xi = (w[j] - k[j] * vi_k[m]) / (vTi[m] * k[j])
+            dZ_re, dZ_im = _plasma_dispersion_func_deriv_jit(xi)
+            sumChiI_re -= kDi2[m] * half_inv_k2 * dZ_re
+            sumChiI_im -= kDi2[m] * half_inv_k2 * dZ_im
+            sumFi += coef_i[m] * np.exp(-(xi ** 2))
+
+        # Calculate the longitudinal dielectric function
+        epsilon_re = 1 + sumChiE_re + sumChiI_re
+        epsilon_im = sumChiE_im + sumChiI_im
+
+        # The screening factors are common to every species, writing the
+        # complex division sum(chiE) / epsilon out in real and imaginary parts
+        inv_epsilon2 = 1 / (epsilon_re ** 2 + epsilon_im ** 2)
+        ratio_re = (sumChiE_re * epsilon_re + sumChiE_im * epsilon_im) * inv_epsilon2
+        ratio_im = (sumChiE_im * epsilon_re - sumChiE_re * epsilon_im) * inv_epsilon2
+        fe = (1 - ratio_re) ** 2 + ratio_im ** 2
+        fi = ratio_re ** 2 + ratio_im ** 2
+
+        Skw[j] = (fe * sumFe + fi * sumFi) / k[j]
+
+    # Compute the mean scattering parameter alpha over all wavelengths and
+    # electron populations, expressed here using the fact that
+    # v_th/w_p = root(2) * Debye length.  The average of
+    # sqrt(2) * wpe / (k * vTe) separates into averages over 1/k and 1/vTe.
+    return np.sqrt(2) * wpe * np.mean(1 / vTe) * np.mean(1 / k)
+
+
+def _plasma_dispersion_func_deriv(x):
+    r"""
+    Derivative of the plasma dispersion function for a real argument.
+
+    For real :math:`x` the plasma dispersion function reduces to
+    :math:`Z(x) = i \sqrt{π} e^{-x^2} - 2 F(x)`, where :math:`F` is
+    Dawson's integral, so :math:`Z'(x) = -2 (1 + x Z(x))` can be
+    evaluated without a complex Faddeeva function.  The real and
+    imaginary parts are returned separately.  ``x`` may be a float or
+    an `~numpy.ndarray`.
+    """
+    return (
+        -2 * (1 - 2 * x * special.dawsn(x)),
+        -2 * np.sqrt(np.pi) * x * np.exp(-(x ** 2)),
+    )
 
-    # Recast as real: imaginary part is already zero
-    Skw = np.real(np.sum(econtr, axis=0) + np.sum(icontr, axis=0))
 
-    return np.mean(alpha), Skw
+# the same function compiled for use inside _spectral_density_core
+_plasma_dispersion_func_deriv_jit = numba.njit(_plasma_dispersion_func_deriv)
@@ -43,6 +43,7 @@ __all__ = [
     "Coulomb_logarithm",
     "impact_parameter_perp",
     "impact_parameter",
+    "CoulombLogTable",
     "collision_frequency",
     "Coulomb_cross_section",
     "fundamental_electron_collision_freq",
@@ -54,24 +55,67 @@ __all__ = [
     "coupling_parameter",
 ]
 
+import functools
+import math
 import numpy as np
 import warnings
 
 from astropy import units as u
 from astropy.constants.si import c, e, eps0, hbar, k_B, m_e
+from collections import namedtuple
 from numpy import pi
+from scipy import ndimage
 
 from plasmapy import particles, utils
-from plasmapy.formulary import parameters
 from plasmapy.formulary.mathematics import Fermi_integral
-from plasmapy.formulary.quantum import (
-    chemical_potential,
-    thermal_deBroglie_wavelength,
-    Wigner_Seitz_radius,
-)
+from plasmapy.formulary.quantum import chemical_potential, thermal_deBroglie_wavelength
 from plasmapy.utils.decorators import validate_quantities
 from plasmapy.utils.decorators.checks import _check_relativistic
 
+# SI values of the constants used on the unitless code paths
+_E = e.value
+_EPS0 = eps0.value
+_HBAR = hbar.value
+_K_B = k_B.value
+_M_E = m_e.value
+_E_SQ = _E * _E
+_FOUR_PI_EPS0 = 4 * pi * _EPS0
+# the squared Debye length is this times T / n_e
+_DEBYE_SQ_COEF = _EPS0 * _K_B / _E_SQ
+# the cube of the Wigner-Seitz radius is this divided by the density
+_WIGNER_SEITZ_CUBE_COEF = 3 / (4 * pi)
+
+# the ways an electron can be named in the species passed to
+# collision_frequency
+_ELECTRON_NAMES = frozenset(("e", "e-"))
+
+# averaging factors relating the fundamental electron and ion collision
+# frequencies to collision_frequency
+_COEFF_E = 4 / math.sqrt(pi) / 3
+# factor of 4 due to reduced mass in bperp and the rest is
+# due to differences in definitions of collisional frequency
+_COEFF_I = math.sqrt(8 / pi) / 3 / 4
+
+# integer ids of the methods of computing the Coulomb logarithm, so that the
+# hot paths can branch on ints instead of comparing strings
+_CLASSICAL, _GMS1, _GMS2, _GMS3, _GMS4, _GMS5, _GMS6 = range(7)
+_METHOD_IDS = {
+    "classical": _CLASSICAL,
+    "ls": _CLASSICAL,
+    "ls_min_interp": _GMS1,
+    "GMS-1": _GMS1,
+    "ls_full_interp": _GMS2,
+    "GMS-2": _GMS2,
+    "ls_clamp_mininterp": _GMS3,
+    "GMS-3": _GMS3,
+    "hls_min_interp": _GMS4,
+    "GMS-4": _GMS4,
+    "hls_max_interp": _GMS5,
+    "GMS-5": _GMS5,
+    "hls_full_interp": _GMS6,
+    "GMS-6": _GMS6,
+}
+
 
 @validate_quantities(
     T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
@@ -400,68 +444,84 @@ def Coulomb_logarithm(
     --------
     impact_parameter : Computes :math:`b_{min}` and :math:`b_{max}`.
     """
-    # fetching impact min and max impact parameters
-    bmin, bmax = impact_parameter(
-        T=T, n_e=n_e, species=species, z_mean=z_mean, V=V, method=method
+    method_id = _method_id(method)
+
+    # the inputs have already been validated, so skip the decorated
+    # impact_parameter and work on plain SI floats/arrays from here on
+    T, masses, charges, reduced_mass, V = _boilerPlate_impl(T=T, species=species, V=V)
+    return _coulomb_logarithm_si(
+        T=T.to_value(u.K),
+        n_e=n_e.to_value(u.m ** -3),
+        z_mean=_z_mean_value(z_mean),
+        V=V.to_value(u.m / u.s),
+        q1q2=_charge_product(charges),
+        mu=reduced_mass.to_value(u.kg),
+        method_id=method_id,
+        method=method,
     )
 
-    if method in (
-        "classical",
-        "ls",
-        "ls_min_interp",
-        "GMS-1",
-        "ls_full_interp",
-        "GMS-2",
-    ):
-        ln_Lambda = np.log(bmax / bmin)
-    elif method in ("ls_clamp_mininterp", "GMS-3"):
-        ln_Lambda = np.log(bmax / bmin)
-        if np.any(ln_Lambda < 2):
-            if np.isscalar(ln_Lambda.value):
-                ln_Lambda = 2 * u.dimensionless_unscaled
-            else:
-                ln_Lambda[ln_Lambda < 2] = 2 * u.dimensionless_unscaled
-    elif method in (
-        "hls_min_interp",
-        "GMS-4",
-        "hls_max_interp",
-        "GMS-5",
-        "hls_full_interp",
-        "GMS-6",
-    ):
-        ln_Lambda = 0.5 * np.log(1 + bmax ** 2 / bmin ** 2)
-    else:
-        raise ValueError(
-            'Unknown method. Choose from "classical", "ls_min_interp", "ls_full_interp", "ls_clamp_mininterp", "hls_min_interp", "hls_max_interp", "hls_full_interp", and their aliases. Please refer to the documentation of this function for more information.'
-        )
 
-    # applying dimensionless units
-    ln_Lambda = ln_Lambda.to(u.dimensionless_unscaled).value
-
-    # Allow NaNs through the < checks without warning
-    with np.errstate(invalid="ignore"):
-        if np.any(ln_Lambda < 2) and method in [
-            "classical",
-            "ls",
-            "ls_min_interp",
-            "GMS-1",
-            "ls_full_interp",
-            "GMS-2",
-        ]:
-            warnings.warn(
-                f'The Coulomb logarithm is {ln_Lambda}, and the specified method, "{method}", depends on weak coupling.',
-                utils.CouplingWarning,
-            )
-        elif np.any(ln_Lambda < 4):
-            warnings.warn(
-                f"The Coulomb logarithm is {ln_Lambda}, so strong "
-                "coupling effects may exist for the plasma.",
-                utils.CouplingWarning,
-            )
+def _coulomb_logarithm_si(T, n_e, z_mean, V, q1q2, mu, method_id, method):
+    """
+    Body of `Coulomb_logarithm` on plain SI floats or arrays, taking the
+    same arguments as `_impact_parameter_impl` plus the ``method`` name
+    for the warning messages.  Used directly by callers that have already
+    validated their inputs and resolved the species.
+    """
+    kwargs = dict(
+        T=T, n_e=n_e, z_mean=z_mean, V=V, q1q2=q1q2, mu=mu, method_id=method_id
+    )
+
+    # ln(bmax / bmin) is taken as half the log of the squared ratio, so
+    # the impact parameters themselves never need a square root
+    bmin_sq, bmax_sq = _impact_parameter_squared_impl(**kwargs)
+    ln_Lambda = _METHODS[method_id].ln_Lambda(bmax_sq / bmin_sq)
+
+    # a single reduction decides whether to warn; NaNs are skipped
+    ln_Lambda_min = np.fmin.reduce(np.ravel(ln_Lambda), initial=np.inf)
+    if ln_Lambda_min < 2 and _METHODS[method_id].needs_weak_coupling:
+        warnings.warn(
+            f"{_describe_ln_Lambda(ln_Lambda, ln_Lambda_min, 2)}, and the specified "
+            f'method, "{method}", depends on weak coupling.',
+            utils.CouplingWarning,
+        )
+    elif ln_Lambda_min < 4:
+        warnings.warn(
+            f"{_describe_ln_Lambda(ln_Lambda, ln_Lambda_min, 4)}, so strong "
+            "coupling effects may exist for the plasma.",
+            utils.CouplingWarning,
+        )
 
     return ln_Lambda
 
 
+def _describe_ln_Lambda(ln_Lambda, ln_Lambda_min, threshold):
+    """
+    Describe the Coulomb logarithm for a `~plasmapy.utils.CouplingWarning`
+    message without formatting every element of a large array.
+    """
+    if np.size(ln_Lambda) == 1:
+        return f"The Coulomb logarithm is {ln_Lambda}"
+    below = np.count_nonzero(ln_Lambda < threshold)
+    return (
+        f"The Coulomb logarithm is below {threshold} for {below} of "
+        f"{np.size(ln_Lambda)} values (minimum {ln_Lambda_min:.3g})"
+    )
+
+
+def _method_id(method):
+    """
+    Look up the integer id of a method of computing the Coulomb logarithm,
+    raising a `ValueError` if ``method`` is not supported.
+    """
+    try:
+        return _METHOD_IDS[method]
+    except (KeyError, TypeError):
+        raise ValueError(
+            'Unknown method. Choose from "classical", "ls_min_interp", "ls_full_interp", "ls_clamp_mininterp", "hls_min_interp", "hls_max_interp", "hls_full_interp", and their aliases. Please refer to the documentation of this function for more information.'
+        ) from None
+
+
 @validate_quantities(T={"equivalencies": u.temperature_energy()})
 @particles.particle_input
 def _boilerPlate(T: u.K, species: (particles.Particle, particles.Particle), V):
@@ -470,11 +530,22 @@ def _boilerPlate(T: u.K, species: (particles.Particle, particles.Particle), V):
     reduced in mass in a 2 particle collision system along with thermal
     velocity.
     """
-    masses = [p.mass for p in species]
-    charges = [np.abs(p.charge) for p in species]
+    return _boilerPlate_impl(T, species, V)
+
+
+def _boilerPlate_impl(T, species, V):
+    """
+    Undecorated body of `_boilerPlate`, for callers whose ``T`` and
+    ``species`` have already been validated.
+    """
+    masses_kg, charges_C, reduced_mass_kg = _species_properties(
+        species[0].symbol, species[1].symbol
+    )
+    masses = (masses_kg[0] * u.kg, masses_kg[1] * u.kg)
+    charges = (charges_C[0] * u.C, charges_C[1] * u.C)
 
     # obtaining reduced mass of 2 particle collision system
-    reduced_mass = particles.reduced_mass(*species)
+    reduced_mass = reduced_mass_kg * u.kg
 
     # getting thermal velocity of system if no velocity is given
     V = _replaceNanVwithThermalV(V, T, reduced_mass)
@@ -484,27 +555,90 @@ def _boilerPlate(T: u.K, species: (particles.Particle, particles.Particle), V):
     return T, masses, charges, reduced_mass, V
 
 
+def _particle_pair(species):
+    """
+    Narrow stand-in for the `~plasmapy.particles.particle_input` check on
+    ``species`` for callers whose remaining inputs have already been
+    validated by their own `~plasmapy.utils.decorators.validate_quantities`.
+    """
+    if len(species) != 2:
+        raise ValueError(
+            f"Number of parameters allowed in the tuple (2 parameters) are "
+            f"not equal to number of parameters passed in the tuple "
+            f"({len(species)} parameters)."
+        )
+    return tuple(
+        p if isinstance(p, particles.Particle) else particles.Particle(p)
+        for p in species
+    )
+
+
+def _charge_product(charges):
+    """
+    Product in C² of the absolute ``charges`` returned by `_boilerPlate`,
+    which are always in C, so their bare values are multiplied directly.
+    """
+    return charges[0].value * charges[1].value
+
+
+@functools.lru_cache(maxsize=64)
+def _species_properties(symbol1, symbol2):
+    """
+    Masses in kg, absolute charges in C, and reduced mass in kg of the
+    particles with symbols ``symbol1`` and ``symbol2``, cached since the
+    same pairs recur on every call.
+    """
+    particle1, particle2 = particles.Particle(symbol1), particles.Particle(symbol2)
+    masses = (particle1.mass.to_value(u.kg), particle2.mass.to_value(u.kg))
+    charges = (abs(particle1.charge.to_value(u.C)), abs(particle2.charge.to_value(u.C)))
+    reduced_mass = particles.reduced_mass(symbol1, symbol2).to_value(u.kg)
+    return masses, charges, reduced_mass
+
+
+@functools.lru_cache(maxsize=128)
+def _ion_mass_kg_and_charge_number(ion):
+    """
+    Mass in kg and charge number of the particle ``ion``, cached since
+    the same ion is passed on every call of a sweep.
+    """
+    return particles.particle_mass(ion).to_value(u.kg), particles.charge_number(ion)
+
+
+def _thermal_speed(T, m):
+    """
+    Most probable thermal speed of particles of mass ``m`` at temperature
+    ``T``, as `~plasmapy.formulary.parameters.thermal_speed` would give it,
+    without re-validating inputs that `_boilerPlate` has already checked.
+    """
+    return np.sqrt(2 * _K_B * T.to_value(u.K) / m.to_value(u.kg)) * (u.m / u.s)
+
+
 def _replaceNanVwithThermalV(V, T, m):
     """
     Get thermal velocity of system if no velocity is given, for a given mass.
     Handles vector checks for ``V``, you must already know that ``T`` and ``m``
     are okay.
     """
-    if np.any(V == 0):
-        raise utils.PhysicsError("You cannot have a collision for zero velocity!")
     # getting thermal velocity of system if no velocity is given
-
     if V is None:
-        V = parameters.thermal_speed(T, "e-", mass=m)
-    elif np.any(np.isnan(V)):
-        if np.isscalar(V.value) or np.isscalar(T.value):
-            if np.isscalar(V.value):
-                V = parameters.thermal_speed(T, "e-", mass=m)
-            if np.isscalar(T.value):
-                V[np.isnan(V)] = parameters.thermal_speed(T, "e-", mass=m)
-        else:
-            V = V.copy()
-            V[np.isnan(V)] = parameters.thermal_speed(T[np.isnan(V)], "e-", mass=m)
+        return _thermal_speed(T, m)
+
+    # do the zero and NaN checks on the bare values rather than the Quantity
+    V_value = np.asarray(V.value)
+    if np.any(V_value == 0):
+        raise utils.PhysicsError("You cannot have a collision for zero velocity!")
+
+    mask = np.isnan(V_value)
+    if not mask.any():
+        return V
+    if mask.ndim == 0:
+        return _thermal_speed(T, m)
+
+    V = V.copy()
+    if np.isscalar(T.value):
+        V[mask] = _thermal_speed(T, m)
+    else:
+        V[mask] = _thermal_speed(T[mask], m)
 
     return V
 
@@ -592,8 +726,21 @@ def impact_parameter_perp(
     # classical effects dominate.
     # !!!Note: an average ionization parameter will have to be
     # included here in the future
-    bPerp = charges[0] * charges[1] / (4 * pi * eps0 * reduced_mass * V ** 2)
-    return bPerp
+    bPerp = _impact_parameter_perp_si(
+        _charge_product(charges),
+        reduced_mass.to_value(u.kg),
+        V.to_value(u.m / u.s),
+    )
+    return bPerp * u.m
+
+
+def _impact_parameter_perp_si(q1q2, mu, V):
+    """
+    Distance of closest approach for a 90° collision, computed on plain
+    SI floats or arrays: the charge product ``q1q2`` in C², the reduced
+    mass ``mu`` in kg, and the relative velocity ``V`` in m/s.
+    """
+    return q1q2 / (_FOUR_PI_EPS0 * mu * V * V)
 
 
 @validate_quantities(
@@ -718,106 +865,342 @@ def impact_parameter(
        DOI: 10.1103/PhysRevE.65.036418
     """
     # boiler plate checks
+    method_id = _method_id(method)
     T, masses, charges, reduced_mass, V = _boilerPlate(T=T, species=species, V=V)
+    bmin, bmax = _impact_parameter_impl(
+        T=T.to_value(u.K),
+        n_e=n_e.to_value(u.m ** -3),
+        z_mean=_z_mean_value(z_mean),
+        V=V.to_value(u.m / u.s),
+        q1q2=_charge_product(charges),
+        mu=reduced_mass.to_value(u.kg),
+        method_id=method_id,
+    )
+    return bmin * u.m, bmax * u.m
+
+
+def _z_mean_value(z_mean):
+    """Strip the units from a validated ``z_mean``, mapping `None` to NaN."""
+    if z_mean is None:
+        return np.nan
+    return z_mean.to_value(u.dimensionless_unscaled)
+
+
+def _resolve_z(z_mean, charges):
+    """
+    Mean charge number from the bare ``z_mean``, falling back to the mean
+    of the absolute charge numbers of the two ``charges`` where it is NaN.
+    """
+    Z_species = (charges[0] + charges[1]).to_value(u.C) / (2 * _E)
+    return np.where(np.isnan(z_mean), Z_species, z_mean)[()]
+
+
+def _check_z_mean(z_mean, method_id):
+    """
+    Raise a `ValueError` if the method needs the mean ion density but no
+    ``z_mean`` was given.
+    """
     # catching error where mean charge state is not given for non-classical
     # methods that require the ion density
-    if method in (
-        "ls_full_interp",
-        "GMS-2",
-        "hls_max_interp",
-        "GMS-5",
-        "hls_full_interp",
-        "GMS-6",
-    ):
-        if np.isnan(z_mean):
-            raise ValueError(
-                'Must provide a z_mean for "ls_full_interp", "hls_max_interp", and "hls_full_interp" methods.'
-            )
-    # Debye length
-    lambdaDe = parameters.Debye_length(T, n_e)
+    if _METHODS[method_id].needs_z_mean and np.isnan(z_mean).any():
+        raise ValueError(
+            'Must provide a z_mean for "ls_full_interp", "hls_max_interp", and "hls_full_interp" methods.'
+        )
+
+
+def _impact_parameter_impl(T, n_e, z_mean, V, q1q2, mu, method_id):
+    """
+    Compute the impact parameters ``(bmin, bmax)`` in meters from plain SI
+    floats or arrays: ``T`` in K, ``n_e`` in m⁻³, ``V`` in m/s, the charge
+    product ``q1q2`` in C², and the reduced mass ``mu`` in kg.  ``method_id``
+    is one of the integer ids in ``_METHOD_IDS``.  The inputs are assumed to
+    have already been validated by the calling function.  See
+    `impact_parameter` for the methods and references.
+    """
+    bmin_sq, bmax_sq = _impact_parameter_squared_impl(
+        T, n_e, z_mean, V, q1q2, mu, method_id
+    )
+    return np.sqrt(bmin_sq), np.sqrt(bmax_sq)
+
+
+def _impact_parameter_squared_impl(T, n_e, z_mean, V, q1q2, mu, method_id):
+    """
+    Compute the squared impact parameters ``(bmin**2, bmax**2)`` in m²,
+    taking the same arguments as `_impact_parameter_impl`.  The Coulomb
+    logarithm only needs the ratio of the squares, so working with them
+    directly avoids a square root per element for the interpolated methods.
+    """
+    _check_z_mean(z_mean, method_id)
+    T, n_e, z_mean, V = _broadcast_inputs(T, n_e, z_mean, V)
+    # Debye length squared
+    lambdaDe_sq = _DEBYE_SQ_COEF * T / n_e
     # de Broglie wavelength
-    lambdaBroglie = hbar / (2 * reduced_mass * V)
+    lambdaBroglie = _HBAR / (2 * mu * V)
     # distance of closest approach in 90° Coulomb collision
-    bPerp = impact_parameter_perp(T=T, species=species, V=V)
+    bPerp = _impact_parameter_perp_si(q1q2, mu, V)
 
     # obtaining minimum and maximum impact parameters depending on which
     # method is requested
-    if method == "classical" or method == "ls":
-        bmax = lambdaDe
-        # Coulomb-style collisions will not happen for impact parameters
-        # shorter than either of these two impact parameters, so we choose
-        # the larger of these two possibilities. That is, between the
-        # de Broglie wavelength and the distance of closest approach.
-        # ARRAY NOTES
-        # T and V should be guaranteed to be same size inputs from _boilerplate
-        # therefore, lambdaBroglie and bPerp are either both scalar or both array
-        # if np.isscalar(bPerp.value) and np.isscalar(lambdaBroglie.value):  # both scalar
-        try:  # assume both scalar
-            if bPerp > lambdaBroglie:
-                bmin = bPerp
-            else:
-                bmin = lambdaBroglie
-        # else:  # both lambdaBroglie and bPerp are arrays
-        except ValueError:  # both lambdaBroglie and bPerp are arrays
-            bmin = lambdaBroglie
-            bmin[bPerp > lambdaBroglie] = bPerp[bPerp > lambdaBroglie]
-    elif method == "ls_min_interp" or method == "GMS-1":
-        # 1st method listed in Table 1 of reference [1]
-        # This is just another form of the classical Landau-Spitzer
-        # approach, but bmin is interpolated between the de Broglie
-        # wavelength and distance of closest approach.
-        bmax = lambdaDe
-        bmin = (lambdaBroglie ** 2 + bPerp ** 2) ** (1 / 2)
-    elif method == "ls_full_interp" or method == "GMS-2":
-        # 2nd method listed in Table 1 of reference [1]
-        # Another Landau-Spitzer like approach, but now bmax is also
-        # being interpolated. The interpolation is between the Debye
-        # length and the ion sphere radius, allowing for descriptions
-        # of dilute plasmas.
-        # Mean ion density.
-        n_i = n_e / z_mean
-        # mean ion sphere radius.
-        ionRadius = Wigner_Seitz_radius(n_i)
-        bmax = (lambdaDe ** 2 + ionRadius ** 2) ** (1 / 2)
-        bmin = (lambdaBroglie ** 2 + bPerp ** 2) ** (1 / 2)
-    elif method == "ls_clamp_mininterp" or method == "GMS-3":
-        # 3rd method listed in Table 1 of reference [1]
-        # same as GMS-1, but not Lambda has a clamp at Lambda_min = 2
-        # where Lambda is the argument to the Coulomb logarithm.
-        bmax = lambdaDe
-        bmin = (lambdaBroglie ** 2 + bPerp ** 2) ** (1 / 2)
-    elif method == "hls_min_interp" or method == "GMS-4":
-        # 4th method listed in Table 1 of reference [1]
-        bmax = lambdaDe
-        bmin = (lambdaBroglie ** 2 + bPerp ** 2) ** (1 / 2)
-    elif method == "hls_max_interp" or method == "GMS-5":
-        # 5th method listed in Table 1 of reference [1]
-        # Mean ion density.
-        n_i = n_e / z_mean
-        # mean ion sphere radius.
-        ionRadius = Wigner_Seitz_radius(n_i)
-        bmax = (lambdaDe ** 2 + ionRadius ** 2) ** (1 / 2)
-        bmin = bPerp
-    elif method == "hls_full_interp" or method == "GMS-6":
-        # 6th method listed in Table 1 of reference [1]
-        # Mean ion density.
-        n_i = n_e / z_mean
-        # mean ion sphere radius.
-        ionRadius = Wigner_Seitz_radius(n_i)
-        bmax = (lambdaDe ** 2 + ionRadius ** 2) ** (1 / 2)
-        bmin = (lambdaBroglie ** 2 + bPerp ** 2) ** (1 / 2)
-    else:
-        raise ValueError(f"Method {method} not found!")
+    method = _METHODS[method_id]
+    bmin_sq = method.bmin_sq(lambdaBroglie, bPerp)
+    bmax_sq = method.bmax_sq(lambdaDe_sq, n_e, z_mean)
+    return bmin_sq, bmax_sq
+
 
-    # ARRAY NOTES
-    # it could be that bmin and bmax have different sizes. If Te is a scalar,
-    # T and V will be scalar from _boilerplate, so bmin will scalar.  However
-    # if n_e is an array, than bmax will be an array. if this is the case,
-    # do we want to extend the scalar bmin to equal the length of bmax? Sure.
-    if np.isscalar(bmin.value) and not np.isscalar(bmax.value):
-        bmin = np.repeat(bmin, len(bmax))
+def _broadcast_inputs(T, n_e, z_mean, V):
+    """
+    Broadcast the unitless inputs to a common shape as contiguous float
+    arrays, so that every intermediate (and both of ``bmin`` and ``bmax``)
+    has that shape.  All-scalar inputs are returned unchanged.
+    """
+    if not any(np.ndim(arr) for arr in (T, n_e, z_mean, V)):
+        return T, n_e, z_mean, V
+    return tuple(
+        np.ascontiguousarray(arr, dtype=np.float64)
+        for arr in np.broadcast_arrays(T, n_e, z_mean, V)
+    )
 
-    return bmin.to(u.m), bmax.to(u.m)
+
+def _bmin_sq_max(lambdaBroglie, bPerp):
+    # Coulomb-style collisions will not happen for impact parameters
+    # shorter than either of these two impact parameters, so we choose
+    # the larger of these two possibilities. That is, between the
+    # de Broglie wavelength and the distance of closest approach.
+    bmin = np.maximum(bPerp, lambdaBroglie)
+    return bmin * bmin
+
+
+def _bmin_sq_interp(lambdaBroglie, bPerp):
+    # bmin is interpolated between the de Broglie wavelength and the
+    # distance of closest approach
+    return lambdaBroglie * lambdaBroglie + bPerp * bPerp
+
+
+def _bmin_sq_perp(lambdaBroglie, bPerp):
+    return bPerp * bPerp
+
+
+def _bmax_sq_debye(lambdaDe_sq, n_e, z_mean):
+    return lambdaDe_sq
+
+
+def _bmax_sq_interp(lambdaDe_sq, n_e, z_mean):
+    # bmax is interpolated between the Debye length and the mean ion
+    # sphere radius, allowing for descriptions of dilute plasmas
+    ionRadius = _wigner_seitz_radius_si(n_e / z_mean)
+    return lambdaDe_sq + ionRadius * ionRadius
+
+
+def _wigner_seitz_radius_si(n):
+    """
+    `~plasmapy.formulary.quantum.Wigner_Seitz_radius` in m for a number
+    density in m⁻³, without the unit validation.
+    """
+    return np.cbrt(_WIGNER_SEITZ_CUBE_COEF / n)
+
+
+def _ln_Lambda_ls(ratio_sq):
+    return 0.5 * np.log(ratio_sq)
+
+
+def _ln_Lambda_ls_clamp(ratio_sq):
+    # clamp at ln(Lambda) = 2
+    return np.maximum(0.5 * np.log(ratio_sq), 2.0)
+
+
+def _ln_Lambda_hls(ratio_sq):
+    return 0.5 * np.log1p(ratio_sq)
+
+
+_CoulombLogMethod = namedtuple(
+    "_CoulombLogMethod",
+    [
+        "bmin_sq",
+        "bmax_sq",
+        "ln_Lambda",
+        "needs_z_mean",
+        "needs_weak_coupling",
+    ],
+)
+_CoulombLogMethod.__doc__ = """
+The pieces that make up one method of computing the Coulomb logarithm:
+functions giving the squared ``bmin`` and ``bmax`` and ``ln_Lambda`` from
+the squared ratio of the two, whether ``z_mean`` is required, and whether
+the method is only valid at weak coupling.
+"""
+
+# the method numbers in the comments refer to Table 1 of Gericke et al.,
+# PRE 65, 036418 (2002); see the docstring of Coulomb_logarithm
+_METHODS = {
+    _CLASSICAL: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_max,
+        bmax_sq=_bmax_sq_debye,
+        ln_Lambda=_ln_Lambda_ls,
+        needs_z_mean=False,
+        needs_weak_coupling=True,
+    ),
+    # 1st method
+    _GMS1: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_interp,
+        bmax_sq=_bmax_sq_debye,
+        ln_Lambda=_ln_Lambda_ls,
+        needs_z_mean=False,
+        needs_weak_coupling=True,
+    ),
+    # 2nd method
+    _GMS2: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_interp,
+        bmax_sq=_bmax_sq_interp,
+        ln_Lambda=_ln_Lambda_ls,
+        needs_z_mean=True,
+        needs_weak_coupling=True,
+    ),
+    # 3rd method, same as GMS-1 but clamped
+    _GMS3: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_interp,
+        bmax_sq=_bmax_sq_debye,
+        ln_Lambda=_ln_Lambda_ls_clamp,
+        needs_z_mean=False,
+        needs_weak_coupling=False,
+    ),
+    # 4th method
+    _GMS4: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_interp,
+        bmax_sq=_bmax_sq_debye,
+        ln_Lambda=_ln_Lambda_hls,
+        needs_z_mean=False,
+        needs_weak_coupling=False,
+    ),
+    # 5th method
+    _GMS5: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_perp,
+        bmax_sq=_bmax_sq_interp,
+        ln_Lambda=_ln_Lambda_hls,
+        needs_z_mean=True,
+        needs_weak_coupling=False,
+    ),
+    # 6th method
+    _GMS6: _CoulombLogMethod(
+        bmin_sq=_bmin_sq_interp,
+        bmax_sq=_bmax_sq_interp,
+        ln_Lambda=_ln_Lambda_hls,
+        needs_z_mean=True,
+        needs_weak_coupling=False,
+    ),
+}
+
+
+class CoulombLogTable:
+    r"""
+    Tabulated Coulomb logarithm for a fixed pair of species and method.
+
+    The Coulomb logarithm is computed once with `Coulomb_logarithm` on a
+    logarithmically spaced grid of temperatures and electron densities,
+    assuming the thermal relative velocity.  Calling the table then
+    bilinearly interpolates in :math:`\log T` and :math:`\log n_e`,
+    which is much cheaper than a full `Coulomb_logarithm` call when the
+    same species and method are evaluated repeatedly, e.g. inside a
+    transport solver.
+
+    Parameters
+    ----------
+    species : `tuple`
+        A tuple containing string representations of the test particle
+        (listed first) and the target particle (listed second).
+
+    method : `str`, optional
+        The method by which to compute the Coulomb logarithm.  See
+        `Coulomb_logarithm` for the supported methods.
+
+    z_mean : `~astropy.units.Quantity`, optional
+        The average ionization, required for the methods that use the
+        ion sphere radius.  See `Coulomb_logarithm`.
+
+    T_range : `~astropy.units.Quantity`, optional
+        The lower and upper temperature bounds of the table, in units of
+        temperature or energy per particle.  Defaults to 100 K to 1e9 K.
+
+    n_range : `~astropy.units.Quantity`, optional
+        The lower and upper electron density bounds of the table.
+        Defaults to 1e10 to 1e30 m\ :sup:`-3`.
+
+    N : `int`, optional
+        The number of grid points along each axis.  Defaults to 256.
+
+    Notes
+    -----
+    Values requested outside of ``T_range`` or ``n_range`` are returned
+    as NaN.  The interpolation error decreases with ``N``; for the
+    default grid it is below about 0.01 in :math:`\ln{Λ}`.
+
+    Examples
+    --------
+    >>> from astropy import units as u
+    >>> table = CoulombLogTable(('e-', 'p+'))
+    >>> table(1e6 * u.K, 1e19 * u.m**-3)
+    14.5455...
+    """
+
+    def __init__(
+        self,
+        species,
+        method="classical",
+        z_mean=np.nan * u.dimensionless_unscaled,
+        T_range=(1e2, 1e9) * u.K,
+        n_range=(1e10, 1e30) * u.m ** -3,
+        N=256,
+    ):
+        T_min, T_max = np.log10(
+            T_range.to_value(u.K, equivalencies=u.temperature_energy())
+        )
+        n_min, n_max = np.log10(n_range.to_value(u.m ** -3))
+        self._log_T_min = T_min
+        self._log_n_min = n_min
+        self._log_T_step = (T_max - T_min) / (N - 1)
+        self._log_n_step = (n_max - n_min) / (N - 1)
+
+        T_grid = np.logspace(T_min, T_max, N) * u.K
+        n_grid = np.logspace(n_min, n_max, N) * u.m ** -3
+        with warnings.catch_warnings():
+            # the table spans strongly coupled and relativistic plasmas by
+            # design, so only warn when individual values are computed
+            warnings.simplefilter("ignore", utils.CouplingWarning)
+            warnings.simplefilter("ignore", utils.RelativityWarning)
+            self._table = Coulomb_logarithm(
+                T_grid[:, np.newaxis],
+                n_grid[np.newaxis, :],
+                species,
+                z_mean=z_mean,
+                method=method,
+            )
+
+    @validate_quantities(
+        T={"can_be_negative": False, "equivalencies": u.temperature_energy()},
+        n_e={"can_be_negative": False},
+    )
+    def __call__(self, T: u.K, n_e: u.m ** -3):
+        """
+        Interpolate the Coulomb logarithm at temperature ``T`` and electron
+        density ``n_e``.
+
+        Returns
+        -------
+        ln_Lambda : `float` or `numpy.ndarray`
+            The dimensionless Coulomb logarithm.
+        """
+        T, n_e = np.broadcast_arrays(T.to_value(u.K), n_e.to_value(u.m ** -3))
+        coordinates = [
+            (np.log10(T) - self._log_T_min) / self._log_T_step,
+            (np.log10(n_e) - self._log_n_min) / self._log_n_step,
+        ]
+        ln_Lambda = ndimage.map_coordinates(
+            self._table,
+            [coord.ravel() for coord in coordinates],
+            order=1,
+            mode="constant",
+            cval=np.nan,
+        )
+        return ln_Lambda.reshape(T.shape)[()]
 
 
 @validate_quantities(
@@ -935,49 +1318,82 @@ def collision_frequency(
     """
     # boiler plate checks
     T, masses, charges, reduced_mass, V_r = _boilerPlate(T=T, species=species, V=V)
-    # using a more descriptive name for the thermal velocity using
-    # reduced mass
-    V_reduced = V_r
+    freq = _collision_frequency_impl(
+        T, n, species, z_mean, V, method, charges, reduced_mass, V_r
+    )
+    return freq * u.Hz
 
-    if species[0] in ("e", "e-") and species[1] in ("e", "e-"):
+
+def _collision_frequency_impl(
+    T, n, species, z_mean, V, method, charges, reduced_mass, V_r, coulomb_log=None
+):
+    """
+    Body of `collision_frequency` on validated inputs, taking
+    ``charges``, ``reduced_mass`` and ``V_r`` from a `_boilerPlate` call
+    already made by the caller, so that the impact parameter and Coulomb
+    logarithm are computed without validating the inputs again.  A
+    precomputed ``coulomb_log`` is used in place of the Coulomb
+    logarithm.  The frequency is returned in Hz without units, so that
+    callers combining it with other factors attach units only once.
+    """
+    q1q2 = _charge_product(charges)
+    mu = reduced_mass.to_value(u.kg)
+
+    # str() gives the symbol of a Particle, so both forms are matched
+    s0_is_e, s1_is_e = (str(particle) in _ELECTRON_NAMES for particle in species)
+    if s0_is_e and s1_is_e:
         # electron-electron collision
         # if a velocity was passed, we use that instead of the reduced
-        # thermal velocity
-        V = _replaceNanVwithThermalV(V, T, reduced_mass)
+        # thermal velocity, which _boilerPlate already substituted
+        V = V_r.to_value(u.m / u.s)
         # impact parameter for 90° collision
-        bPerp = impact_parameter_perp(T=T, species=species, V=V_reduced)
-        print(T, n, species, z_mean, method)
-        # Coulomb logarithm
-        cou_log = Coulomb_logarithm(T, n, species, z_mean, V=V, method=method)
-    elif species[0] in ("e", "e-") or species[1] in ("e", "e-"):
+        bPerp = _impact_parameter_perp_si(q1q2, mu, V)
+    elif s0_is_e or s1_is_e:
         # electron-ion collision
         # Need to manually pass electron thermal velocity to obtain
         # correct perpendicular collision radius
         # we ignore the reduced velocity and use the electron thermal
         # velocity instead
         V = _replaceNanVwithThermalV(V, T, m_e)
+        _check_relativistic(V, "V")
+        V = V.to_value(u.m / u.s)
         # need to also correct mass in collision radius from reduced
         # mass to electron mass
-        bPerp = impact_parameter_perp(T=T, species=species, V=V) * reduced_mass / m_e
-        # Coulomb logarithm
-        # !!! may also need to correct Coulomb logarithm to be
-        # electron-electron version !!!
-        cou_log = Coulomb_logarithm(T, n, species, z_mean, V=V, method=method)
+        bPerp = _impact_parameter_perp_si(q1q2, _M_E, V)
     else:
         # ion-ion collision
         # if a velocity was passed, we use that instead of the reduced
-        # thermal velocity
-        V = _replaceNanVwithThermalV(V, T, reduced_mass)
-        bPerp = impact_parameter_perp(T=T, species=species, V=V)
-        # Coulomb logarithm
-        cou_log = Coulomb_logarithm(T, n, species, z_mean, V=V, method=method)
+        # thermal velocity, which _boilerPlate already substituted
+        V = V_r.to_value(u.m / u.s)
+        bPerp = _impact_parameter_perp_si(q1q2, mu, V)
+
+    # Coulomb logarithm
+    # !!! may also need to correct Coulomb logarithm to be
+    # electron-electron version for electron-ion collisions !!!
+    if coulomb_log is None:
+        cou_log = _coulomb_logarithm_si(
+            T=T.to_value(u.K),
+            n_e=n.to_value(u.m ** -3),
+            z_mean=_z_mean_value(z_mean),
+            V=V,
+            q1q2=q1q2,
+            mu=mu,
+            method_id=_method_id(method),
+            method=method,
+        )
+    else:
+        cou_log = u.Quantity(coulomb_log, u.dimensionless_unscaled, copy=False).value
+        # the computed Coulomb logarithm would have had the broadcast
+        # shape of the inputs, so the one replacing it keeps that shape
+        shape = np.broadcast(T.value, n.value, _z_mean_value(z_mean), V, cou_log).shape
+        cou_log = np.broadcast_to(cou_log, shape)[()]
 
     # collisional cross section
-    sigma = Coulomb_cross_section(bPerp)
+    sigma = _Coulomb_cross_section_si(bPerp)
     # collision frequency where Coulomb logarithm accounts for
     # small angle collisions, which are more frequent than large
     # angle collisions.
-    freq = n * sigma * V * cou_log
+    freq = _collision_frequency_si(n.to_value(u.m ** -3), sigma, V, cou_log)
     return freq
 
 
@@ -1019,8 +1435,21 @@ def Coulomb_cross_section(impact_param: u.m) -> u.m ** 2:
     ----------
     .. [1] https://en.wikipedia.org/wiki/Cross_section_(physics)#Collision_among_gas_particles
     """
-    sigma = np.pi * (2 * impact_param) ** 2
-    return sigma
+    sigma = _Coulomb_cross_section_si(impact_param.to_value(u.m))
+    return sigma * u.m ** 2
+
+
+def _Coulomb_cross_section_si(impact_param):
+    """`Coulomb_cross_section` in m² for an impact parameter in m."""
+    return 4 * pi * impact_param * impact_param
+
+
+def _collision_frequency_si(n, sigma, V, ln_Lambda):
+    """
+    Collision frequency in Hz from the density in m⁻³, the cross section
+    in m², the velocity in m/s and the Coulomb logarithm.
+    """
+    return n * sigma * V * ln_Lambda
 
 
 @validate_quantities(
@@ -1132,24 +1561,23 @@ def fundamental_electron_collision_freq(
     V = _replaceNanVwithThermalV(V, T_e, m_e)
 
     species = [ion, "e-"]
-    Z_i = particles.charge_number(ion)
-    nu = collision_frequency(
-        T_e, n_e, species, z_mean=Z_i, V=V, method=coulomb_log_method
+    _, Z_i = _ion_mass_kg_and_charge_number(ion)
+    # a Coulomb logarithm value passed by the user (``None`` if not)
+    # replaces the computed one
+    T_e, masses, charges, reduced_mass, V_r = _boilerPlate(T=T_e, species=species, V=V)
+    nu = _collision_frequency_impl(
+        T_e,
+        n_e,
+        species,
+        Z_i * u.dimensionless_unscaled,
+        V,
+        coulomb_log_method,
+        charges,
+        reduced_mass,
+        V_r,
+        coulomb_log=coulomb_log,
     )
-    coeff = 4 / np.sqrt(np.pi) / 3
-
-    # accounting for when a Coulomb logarithm value is passed
-    if np.any(coulomb_log):
-        cLog = Coulomb_logarithm(
-            T_e, n_e, species, z_mean=Z_i, V=V, method=coulomb_log_method
-        )
-        # dividing out by typical Coulomb logarithm value implicit in
-        # the collision frequency calculation and replacing with
-        # the user defined Coulomb logarithm value
-        nu_mod = nu * coulomb_log / cLog
-        nu_e = coeff * nu_mod
-    else:
-        nu_e = coeff * nu
+    nu_e = _COEFF_E * nu * u.Hz
 
     return nu_e
 
@@ -1265,33 +1693,29 @@ def fundamental_ion_collision_freq(
     collision_frequency
     fundamental_electron_collision_freq
     """
-    m_i = particles.particle_mass(ion)
+    m_i_kg, Z_i = _ion_mass_kg_and_charge_number(ion)
+    m_i = m_i_kg * u.kg
     species = [ion, ion]
 
     # specify to use ion thermal velocity (most probable), not based on reduced mass
     V = _replaceNanVwithThermalV(V, T_i, m_i)
 
-    Z_i = particles.charge_number(ion)
-
-    nu = collision_frequency(
-        T_i, n_i, species, z_mean=Z_i, V=V, method=coulomb_log_method
+    # a Coulomb logarithm value passed by the user (``None`` if not)
+    # replaces the computed one
+    T_i, masses, charges, reduced_mass, V_r = _boilerPlate(T=T_i, species=species, V=V)
+    nu = _collision_frequency_impl(
+        T_i,
+        n_i,
+        species,
+        Z_i * u.dimensionless_unscaled,
+        V,
+        coulomb_log_method,
+        charges,
+        reduced_mass,
+        V_r,
+        coulomb_log=coulomb_log,
     )
-    # factor of 4 due to reduced mass in bperp and the rest is
-    # due to differences in definitions of collisional frequency
-    coeff = np.sqrt(8 / np.pi) / 3 / 4
-
-    # accounting for when a Coulomb logarithm value is passed
-    if np.any(coulomb_log):
-        cLog = Coulomb_logarithm(
-            T_i, n_i, species, z_mean=Z_i, V=V, method=coulomb_log_method
-        )
-        # dividing out by typical Coulomb logarithm value implicit in
-        # the collision frequency calculation and replacing with
-        # the user defined Coulomb logarithm value
-        nu_mod = nu * coulomb_log / cLog
-        nu_i = coeff * nu_mod
-    else:
-        nu_i = coeff * nu
+    nu_i = _COEFF_I * nu * u.Hz
 
     return nu_i
 
@@ -1402,19 +1826,26 @@ def mean_free_path(
     .. [1] Francis, F. Chen. Introduction to plasma physics and controlled
        fusion 3rd edition. Ch 5 (Springer 2015).
     """
+    return _mean_free_path_impl(T, n_e, species, z_mean, V, method) * u.m
+
+
+def _mean_free_path_impl(T, n_e, species, z_mean, V, method):
+    """
+    Body of `mean_free_path` on validated inputs, returning the mean
+    free path in meters without units.
+    """
+    # T was validated by the caller, so only species needs checking
+    # before the boiler plate fetches the velocity
+    species = _particle_pair(species)
+    T, masses, charges, reduced_mass, V_r = _boilerPlate_impl(T=T, species=species, V=V)
     # collisional frequency
-    freq = collision_frequency(
-        T=T, n=n_e, species=species, z_mean=z_mean, V=V, method=method
+    freq = _collision_frequency_impl(
+        T, n_e, species, z_mean, V, method, charges, reduced_mass, V_r
     )
-    # boiler plate to fetch velocity
-    # this has been moved to after collision_frequency to avoid use of
-    # reduced mass thermal velocity in electron-ion collision case.
-    # Should be fine since collision_frequency has its own boiler_plate
-    # check, and we are only using this here to get the velocity.
-    T, masses, charges, reduced_mass, V = _boilerPlate(T=T, species=species, V=V)
-    # mean free path length
-    mfp = V / freq
-    return mfp
+    # mean free path length, using the velocity from the boiler plate
+    # rather than the electron thermal velocity that collision_frequency
+    # substitutes in the electron-ion case
+    return V_r.to_value(u.m / u.s) / freq
 
 
 @validate_quantities(
@@ -1534,18 +1965,23 @@ def Spitzer_resistivity(
        fusion 3rd edition. Ch 5 (Springer 2015).
     .. [2] http://homepages.cae.wisc.edu/~callen/chap2.pdf
     """
-    # collisional frequency
-    freq = collision_frequency(
-        T=T, n=n, species=species, z_mean=z_mean, V=V, method=method
-    )
     # boiler plate checks
     # fetching additional parameters
-    T, masses, charges, reduced_mass, V = _boilerPlate(T=T, species=species, V=V)
-    if np.isnan(z_mean):
-        spitzer = freq * reduced_mass / (n * charges[0] * charges[1])
-    else:
-        spitzer = freq * reduced_mass / (n * (z_mean * e) ** 2)
-    return spitzer
+    T, masses, charges, reduced_mass, V_r = _boilerPlate(T=T, species=species, V=V)
+    # collisional frequency
+    freq = _collision_frequency_impl(
+        T, n, species, z_mean, V, method, charges, reduced_mass, V_r
+    )
+    z_mean_value = _z_mean_value(z_mean)
+    # the charges of the two species themselves are used where no
+    # z_mean is given
+    q1q2 = np.where(
+        np.isnan(z_mean_value),
+        _charge_product(charges),
+        z_mean_value * z_mean_value * _E_SQ,
+    )[()]
+    spitzer = freq * reduced_mass.to_value(u.kg) / (n.to_value(u.m ** -3) * q1q2)
+    return spitzer * u.Ohm * u.m
 
 
 @validate_quantities(
@@ -1664,20 +2100,16 @@ def mobility(
     ----------
     .. [1] https://en.wikipedia.org/wiki/Electrical_mobility#Mobility_in_gas_phase
     """
-    freq = collision_frequency(
-        T=T, n=n_e, species=species, z_mean=z_mean, V=V, method=method
+    # boiler plate checks, which also recover the charges, mass, etc.
+    species = _particle_pair(species)
+    T, masses, charges, reduced_mass, V_r = _boilerPlate_impl(T=T, species=species, V=V)
+    freq = _collision_frequency_impl(
+        T, n_e, species, z_mean, V, method, charges, reduced_mass, V_r
     )
-    # boiler plate checks
-    # we do this after collision_frequency since collision_frequency
-    # already has a boiler_plate check and we are doing this just
-    # to recover the charges, mass, etc.
-    T, masses, charges, reduced_mass, V = _boilerPlate(T=T, species=species, V=V)
-    if np.isnan(z_mean):
-        z_val = (charges[0] + charges[1]) / 2
-    else:
-        z_val = z_mean * e
-    mobility_value = z_val / (reduced_mass * freq)
-    return mobility_value
+    # the rest is done on bare SI values, attaching units only at the end
+    z_val = _resolve_z(_z_mean_value(z_mean), charges) * _E
+    mobility_value = z_val / (reduced_mass.to_value(u.kg) * freq)
+    return mobility_value * u.m ** 2 / (u.V * u.s)
 
 
 @validate_quantities(
@@ -1797,11 +2229,12 @@ def Knudsen_number(
     ----------
     .. [1] https://en.wikipedia.org/wiki/Knudsen_number
     """
-    path_length = mean_free_path(
-        T=T, n_e=n_e, species=species, z_mean=z_mean, V=V, method=method
-    )
-    knudsen_param = path_length / characteristic_length
-    return knudsen_param
+    # the inputs have already been validated, so skip the decorated
+    # mean_free_path and divide plain values in meters
+    path_length = _mean_free_path_impl(T, n_e, species, z_mean, V, method)
+    length = u.Quantity(characteristic_length, copy=False).to_value(u.m)
+    knudsen_param = path_length / length
+    return knudsen_param * u.dimensionless_unscaled
 
 
 @validate_quantities(
@@ -1853,13 +2286,10 @@ def coupling_parameter(
         where :math:`μ` is the reduced mass.
 
     method : `str`, optional
-        The method by which to compute the Coulomb logarithm.
-        The default method is the classical straight-line Landau-Spitzer
-        method (``"classical"`` or ``"ls"``). The other 6 supported methods
-        are ``"ls_min_interp"``, ``"ls_full_interp"``, ``"ls_clamp_mininterp"``,
-        ``"hls_min_interp"``, ``"hls_max_interp"``, and ``"hls_full_interp"``.
-        Please refer to the docstring of `Coulomb_logarithm` for more
-        information about these methods.
+        The method by which to compute the kinetic energy: ``"classical"``
+        (the default) for the thermal energy, ``"quantum"`` for the energy
+        of a degenerate plasma, or ``"auto"`` to pick between the two for
+        each element.  See the notes section below.
 
     Returns
     -------
@@ -1936,6 +2366,14 @@ def coupling_parameter(
     See equations 1.2, 1.3 and footnote 5 in [2]_ for details on the ideal
     chemical potential.
 
+    With ``method="auto"`` the classical kinetic energy is used where the
+    plasma is non-degenerate, :math:`χ < 1`, and the quantum kinetic energy
+    only where :math:`χ ≥ 1`, so that arrays spanning both regimes are
+    handled in a single call.  The quantum kinetic energy currently relies
+    on `~plasmapy.formulary.quantum.chemical_potential`, which is not yet
+    implemented, so ``"auto"`` raises `NotImplementedError` if any element
+    is degenerate.
+
     Examples
     --------
     >>> from astropy import units as u
@@ -1947,6 +2385,15 @@ def coupling_parameter(
     >>> coupling_parameter(T, n, species, V=1e6 * u.m / u.s)
     <Quantity 5.8033...e-05>
 
+    The inputs broadcast against each other, so the coupling parameter
+    on a grid of temperatures and densities takes a single call:
+
+    >>> import numpy as np
+    >>> T_grid = [1e5, 1e6] * u.K
+    >>> n_grid = [1e18, 1e19, 1e20] * u.m**-3
+    >>> coupling_parameter(T_grid[:, np.newaxis], n_grid, species).shape
+    (2, 3)
+
     References
     ----------
     .. [1] Dense plasma temperature equilibration in the binary collision
@@ -1954,54 +2401,97 @@ def coupling_parameter(
        DOI: 10.1103/PhysRevE.65.036418
     .. [2] Bonitz, Michael. Quantum kinetic theory. Stuttgart: Teubner, 1998.
     """
-    # boiler plate checks
-    T, masses, charges, reduced_mass, V = _boilerPlate(T=T, species=species, V=V)
+    # boiler plate checks; T was already validated by the decorator above
+    species = _particle_pair(species)
+    T, masses, charges, reduced_mass, V = _boilerPlate_impl(T=T, species=species, V=V)
+
+    z_mean = _z_mean_value(z_mean)
+    # using mean charge to get average ion density if no z_mean is given.
+    # If you are running this, you should strongly consider giving
+    # a value of z_mean as an argument instead.
+    Z = _resolve_z(z_mean, charges)
+    # getting ion density from electron density
+    n_i = n_e.to_value(u.m ** -3) / Z
+    # getting Wigner-Seitz radius based on ion density, on the bare
+    # value rather than through the validated Wigner_Seitz_radius
+    radius = _wigner_seitz_radius_si(n_i)
+
+    # Coulomb potential energy between particles in J, which uses the
+    # charges of the two species themselves if no z_mean is given
+    q1q2 = np.where(np.isnan(z_mean), _charge_product(charges), Z * Z * _E_SQ)[()]
+    coulomb_energy = q1q2 / (_FOUR_PI_EPS0 * radius)
+
+    try:
+        kinetic_energy_func = _KINETIC_ENERGY_METHODS[method]
+    except (KeyError, TypeError):
+        raise ValueError(
+            f"Keyword 'method' must be one of 'classical', 'quantum' "
+            f"or 'auto', instead of '{method}'."
+        ) from None
+    kinetic_energy = kinetic_energy_func(T, n_e)
 
-    if np.isnan(z_mean):
-        # using mean charge to get average ion density.
-        # If you are running this, you should strongly consider giving
-        # a value of z_mean as an argument instead.
-        Z1 = np.abs(particles.charge_number(species[0]))
-        Z2 = np.abs(particles.charge_number(species[1]))
-        Z = (Z1 + Z2) / 2
-        # getting ion density from electron density
-        n_i = n_e / Z
-        # getting Wigner-Seitz radius based on ion density
-        radius = Wigner_Seitz_radius(n_i)
-    else:
-        # getting ion density from electron density
-        n_i = n_e / z_mean
-        # getting Wigner-Seitz radius based on ion density
-        radius = Wigner_Seitz_radius(n_i)
-
-    # Coulomb potential energy between particles
-    if np.isnan(z_mean):
-        coulomb_energy = charges[0] * charges[1] / (4 * np.pi * eps0 * radius)
-    else:
-        coulomb_energy = (z_mean * e) ** 2 / (4 * np.pi * eps0 * radius)
-
-    if method == "classical":
-        # classical thermal kinetic energy
-        kinetic_energy = k_B * T
-    elif method == "quantum":
-        # quantum kinetic energy for dense plasmas
-        lambda_deBroglie = thermal_deBroglie_wavelength(T)
-        chem_potential = chemical_potential(n_e, T)
-        fermi_integral = Fermi_integral(chem_potential.si.value, 1.5)
-        denominator = (n_e * lambda_deBroglie ** 3) * fermi_integral
-        kinetic_energy = 2 * k_B * T / denominator
-        if np.all(np.imag(kinetic_energy) == 0):
-            kinetic_energy = np.real(kinetic_energy)
-        else:  # coverage: ignore
+    coupling = coulomb_energy / kinetic_energy
+    return coupling * u.dimensionless_unscaled
+
+
+def _kinetic_energy_classical(T, n_e):
+    """Classical thermal kinetic energy in J for `coupling_parameter`."""
+    return _K_B * T.to_value(u.K)
+
+
+def _kinetic_energy_quantum(T, n_e):
+    """
+    Quantum kinetic energy in J of a dense plasma for `coupling_parameter`.
+    """
+    lambda_deBroglie = thermal_deBroglie_wavelength(T)
+    chem_potential = chemical_potential(n_e, T)
+    fermi_integral = Fermi_integral(
+        chem_potential.to_value(u.dimensionless_unscaled), 1.5
+    )
+    denominator = (n_e * lambda_deBroglie ** 3) * fermi_integral
+    kinetic_energy = 2 * k_B * T / denominator
+    # only a complex result has an imaginary part worth checking
+    if np.iscomplexobj(kinetic_energy):
+        if np.any(kinetic_energy.imag != 0):  # coverage: ignore
             raise ValueError(
                 "Kinetic energy should not be imaginary."
                 "Something went horribly wrong."
             )
-    else:
-        raise ValueError(
-            f"Keyword 'method' must be either 'classical' or "
-            f"'quantum', instead of '{method}'."
-        )
+        kinetic_energy = kinetic_energy.real
+    return kinetic_energy.to_value(u.J)
 
-    coupling = coulomb_energy / kinetic_energy
-    return coupling
+
+def _kinetic_energy_auto(T, n_e):
+    """
+    Classical kinetic energy in J where the electrons are non-degenerate
+    and quantum kinetic energy elsewhere, for `coupling_parameter`.
+    """
+    T, n_e = np.broadcast_arrays(T, n_e, subok=True)
+    degeneracy = (n_e * thermal_deBroglie_wavelength(T) ** 3).to_value(
+        u.dimensionless_unscaled
+    )
+    kinetic_energy = np.array(_kinetic_energy_classical(T, n_e), dtype=float)
+    degenerate = degeneracy >= 1
+    # the quantum branch is only evaluated on the degenerate elements
+    if np.any(degenerate):
+        try:
+            kinetic_energy[degenerate] = _kinetic_energy_quantum(
+                T[degenerate], n_e[degenerate]
+            )
+        except NotImplementedError as err:
+            raise NotImplementedError(
+                "The quantum kinetic energy needed by method='auto' for "
+                "degenerate plasmas (n_e * lambda_deBroglie**3 >= 1) is not "
+                "yet available, see "
+                "https://github.com/PlasmaPy/PlasmaPy/issues/726"
+            ) from err
+    return kinetic_energy[()]
+
+
+# the kinetic energies in the denominator of the coupling parameter,
+# keyed by the method of coupling_parameter
+_KINETIC_ENERGY_METHODS = {
+    "classical": _kinetic_energy_classical,
+    "quantum": _kinetic_energy_quantum,
+    "auto": _kinetic_energy_auto,
+}
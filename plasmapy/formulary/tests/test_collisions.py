@@ -10,6 +10,7 @@ import plasmapy.particles.exceptions
 from plasmapy.formulary.braginskii import Coulomb_logarithm
 from plasmapy.formulary.collisions import (
     collision_frequency,
+    CoulombLogTable,
     coupling_parameter,
     fundamental_electron_collision_freq,
     fundamental_ion_collision_freq,
@@ -907,6 +908,25 @@ class Test_Coulomb_logarithm:
                 self.temperature2, self.density2, self.particles, method="GMS-6"
             )
 
+    def test_GMS6_zmean_array(self):
+        """
+        Tests that an array of z_mean values is accepted, and that a NaN
+        anywhere in it raises the z_mean error.
+        """
+        z_mean = np.array([1.0, 2.0]) * u.dimensionless_unscaled
+        methodVal = Coulomb_logarithm(
+            1e6 * u.K, self.n_arr, self.particles, z_mean=z_mean, method="GMS-6"
+        )
+        assert methodVal.shape == (2,)
+        with pytest.raises(ValueError):
+            Coulomb_logarithm(
+                1e6 * u.K,
+                self.n_arr,
+                self.particles,
+                z_mean=[1.0, np.nan] * u.dimensionless_unscaled,
+                method="GMS-6",
+            )
+
     def test_relativity_warn(self):
         """Tests whether relativity warning is raised at high velocity."""
         with pytest.warns(exceptions.RelativityWarning):
@@ -1103,6 +1123,34 @@ class Test_impact_parameter:
         assert len(bmin) == len(bmax)
 
 
+class Test_CoulombLogTable:
+    @classmethod
+    def setup_class(self):
+        """initializing parameters for tests"""
+        self.particles = ("e", "p")
+        self.T = np.logspace(4, 6, 7) * u.K
+        self.n_e = np.logspace(12, 20, 7) * u.m ** -3
+        self.z_mean = 1.0 * u.dimensionless_unscaled
+
+    @pytest.mark.parametrize("method", ["classical", "GMS-6"])
+    def test_matches_Coulomb_logarithm(self, method):
+        """Test that the interpolated values agree with the direct calculation."""
+        kwargs = {"method": method, "z_mean": self.z_mean}
+        table = CoulombLogTable(self.particles, **kwargs)
+        expected = Coulomb_logarithm(self.T, self.n_e, self.particles, **kwargs)
+        assert np.allclose(table(self.T, self.n_e), expected, rtol=0.0, atol=1e-2)
+
+    def test_scalar(self):
+        """Test that scalar inputs give a scalar result."""
+        table = CoulombLogTable(self.particles)
+        assert np.isscalar(table(1 * u.keV, 1e20 * u.m ** -3))
+
+    def test_out_of_range(self):
+        """Test that values outside of the table are NaN."""
+        table = CoulombLogTable(self.particles, T_range=(1e3, 1e6) * u.K, N=16)
+        assert np.isnan(table(1e7 * u.K, 1e20 * u.m ** -3))
+
+
 class Test_collision_frequency:
     @classmethod
     def setup_class(self):
@@ -1260,6 +1308,35 @@ class Test_fundamental_electron_collision_freq:
             fundamental_electron_collision_freq, insert_some_nans, insert_all_nans, {}
         )
 
+    def test_coulomb_log(self):
+        """A passed Coulomb logarithm, including zero, replaces the computed one"""
+        nu = fundamental_electron_collision_freq(
+            self.T_arr, self.n_arr, self.ion, coulomb_log=self.coulomb_log
+        )
+        nu_double = fundamental_electron_collision_freq(
+            self.T_arr, self.n_arr, self.ion, coulomb_log=2 * self.coulomb_log
+        )
+        nu_zero = fundamental_electron_collision_freq(
+            self.T_arr, self.n_arr, self.ion, coulomb_log=0
+        )
+        assert np.allclose(nu_double, 2 * nu, rtol=1e-12)
+        assert np.all(nu_zero == 0)
+
+    def test_coulomb_log_array_T(self):
+        """A passed Coulomb logarithm keeps the shape of an array T"""
+        V = 1e5 * u.m / u.s
+        nu = fundamental_electron_collision_freq(
+            self.T_arr, self.n_arr[0], self.ion, V=V, coulomb_log=self.coulomb_log
+        )
+        expected = [
+            fundamental_electron_collision_freq(
+                T, self.n_arr[0], self.ion, V=V, coulomb_log=self.coulomb_log
+            ).value
+            for T in self.T_arr
+        ]
+        assert nu.shape == self.T_arr.shape
+        assert np.allclose(nu.value, expected, rtol=1e-12)
+
 
 class Test_fundamental_ion_collision_freq:
     @classmethod
@@ -1279,6 +1356,35 @@ class Test_fundamental_ion_collision_freq:
             fundamental_ion_collision_freq, insert_some_nans, insert_all_nans, {}
         )
 
+    def test_coulomb_log(self):
+        """A passed Coulomb logarithm, including zero, replaces the computed one"""
+        nu = fundamental_ion_collision_freq(
+            self.T_arr, self.n_arr, self.ion, coulomb_log=self.coulomb_log
+        )
+        nu_double = fundamental_ion_collision_freq(
+            self.T_arr, self.n_arr, self.ion, coulomb_log=2 * self.coulomb_log
+        )
+        nu_zero = fundamental_ion_collision_freq(
+            self.T_arr, self.n_arr, self.ion, coulomb_log=0
+        )
+        assert np.allclose(nu_double, 2 * nu, rtol=1e-12)
+        assert np.all(nu_zero == 0)
+
+    def test_coulomb_log_array_T(self):
+        """A passed Coulomb logarithm keeps the shape of an array T"""
+        V = 1e5 * u.m / u.s
+        nu = fundamental_ion_collision_freq(
+            self.T_arr, self.n_arr[0], self.ion, V=V, coulomb_log=self.coulomb_log
+        )
+        expected = [
+            fundamental_ion_collision_freq(
+                T, self.n_arr[0], self.ion, V=V, coulomb_log=self.coulomb_log
+            ).value
+            for T in self.T_arr
+        ]
+        assert nu.shape == self.T_arr.shape
+        assert np.allclose(nu.value, expected, rtol=1e-12)
+
 
 class Test_mean_free_path:
     @classmethod
@@ -1411,6 +1517,20 @@ class Test_Spitzer_resistivity:
         errStr = f"Spitzer resistivity should be {self.True_zmean} and not {methodVal}."
         assert testTrue, errStr
 
+    def test_zmean_array(self):
+        """
+        Test that an array of z_mean, with NaN falling back to the species
+        charges, matches the scalar results.
+        """
+        z_mean = np.array([np.nan, 1, self.z_mean]) * u.dimensionless_unscaled
+        methodVal = Spitzer_resistivity(self.T, self.n, self.particles, z_mean)
+        expected = [
+            Spitzer_resistivity(self.T, self.n, self.particles, z).si.value
+            for z in (np.nan, 1, self.z_mean) * u.dimensionless_unscaled
+        ]
+        assert methodVal.shape == (3,)
+        assert np.allclose(methodVal.si.value, expected, rtol=1e-12, atol=0.0)
+
     # TODO vector z_mean
     @pytest.mark.parametrize("insert_some_nans", [[], ["V"]])
     @pytest.mark.parametrize("insert_all_nans", [[], ["V"]])
@@ -1651,6 +1771,64 @@ class Test_coupling_parameter:
             coupling_parameter, insert_some_nans, insert_all_nans, {}
         )
 
+    def test_zmean_array(self):
+        """
+        Test that an array of z_mean, with NaN falling back to the species
+        charges, matches the scalar results.
+        """
+        z_mean = np.array([np.nan, 1, self.z_mean]) * u.dimensionless_unscaled
+        methodVal = coupling_parameter(self.T, self.n_e, self.particles, z_mean)
+        expected = [
+            coupling_parameter(self.T, self.n_e, self.particles, z)
+            for z in (np.nan, 1, self.z_mean) * u.dimensionless_unscaled
+        ]
+        assert np.allclose(methodVal, expected, rtol=1e-12, atol=0.0)
+        assert np.isclose(methodVal[0], methodVal[1], rtol=1e-12, atol=0.0)
+
+    def test_grid(self):
+        """Test that T and n_e broadcast to a grid of coupling parameters"""
+        T = np.array([1, 10]) * self.T
+        n_e = np.array([0.1, 1, 10]) * self.n_e
+        methodVal = coupling_parameter(T[:, np.newaxis], n_e, self.particles)
+        expected = [[coupling_parameter(t, n, self.particles) for n in n_e] for t in T]
+        assert methodVal.shape == (2, 3)
+        assert np.allclose(methodVal, expected, rtol=1e-12, atol=0.0)
+
+    def test_auto_classical(self):
+        """
+        Test that method="auto" matches the classical method for a
+        non-degenerate plasma.
+        """
+        T = np.array([1, 10]) * self.T
+        methodVal = coupling_parameter(T, self.n_e, self.particles, method="auto")
+        classical = coupling_parameter(T, self.n_e, self.particles)
+        assert np.allclose(methodVal, classical, rtol=1e-12, atol=0.0)
+
+    @pytest.mark.xfail(
+        reason="see issue https://github.com/PlasmaPy/PlasmaPy/issues/726"
+    )
+    def test_auto_mixed(self):
+        """
+        Test that method="auto" uses the classical method for the
+        non-degenerate elements and the quantum method for the degenerate
+        ones.
+        """
+        T = np.array([1e-2, 1, 10]) * self.T
+        methodVal = coupling_parameter(T, self.n_e, self.particles, method="auto")
+        classical = coupling_parameter(T[1:], self.n_e, self.particles)
+        quantum = coupling_parameter(T[0], self.n_e, self.particles, method="quantum")
+        assert np.allclose(methodVal[1:], classical, rtol=1e-12, atol=0.0)
+        assert np.isclose(methodVal[0], quantum, rtol=1e-12, atol=0.0)
+
+    def test_auto_degenerate_error(self):
+        """
+        Test that method="auto" raises NotImplementedError while the
+        quantum method is unavailable for degenerate elements.
+        """
+        T = np.array([1e-2, 1]) * self.T
+        with pytest.raises(NotImplementedError):
+            coupling_parameter(T, self.n_e, self.particles, method="auto")
+
     @pytest.mark.xfail(
         reason="see issue https://github.com/PlasmaPy/PlasmaPy/issues/726"
     )